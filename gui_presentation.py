@@ -11,13 +11,190 @@ This file depends on `presentation.py` in the same folder.
 from __future__ import annotations
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-from typing import Dict
+from typing import Dict, List, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import random
 
+import numpy as np
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import matplotlib.pyplot as plt
-
-from presentation import CubeGrid, sample_bricks, Brick
+from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+
+from presentation import CubeGrid, sample_bricks, Brick, rotate_point
+
+try:
+    from solver_numba import find_placements_kernel
+except Exception:  # numba is optional; try the Cython kernel next
+    try:
+        from solver import find_placements_kernel  # built from solver.pyx
+    except Exception:  # neither compiled kernel; fall back to the bitmask search
+        find_placements_kernel = None
+
+
+def _cubes_mask(cubes, size: int) -> int:
+    """Pack cube coordinates into a bitmask with bit (x*size + y)*size + z per cell."""
+    m = 0
+    for cx, cy, cz in cubes:
+        m |= 1 << ((cx * size + cy) * size + cz)
+    return m
+
+
+def _canonical_rotations() -> List[Tuple[int, int, int]]:
+    """Return one (rx,ry,rz) triple per distinct cube orientation.
+
+    The cube rotation group has order 24, but (rx,ry,rz) in [0,4)^3 reaches
+    each orientation ~2.7 times over. Rotating a chiral, asymmetric reference
+    shape and keeping the first triple per unique normalized result leaves
+    exactly 24 triples.
+    """
+    ref = [(0, 0, 0), (1, 0, 0), (0, 2, 0), (0, 0, 3)]
+    seen = set()
+    triples = []
+    for rx in range(4):
+        for ry in range(4):
+            for rz in range(4):
+                pts = [rotate_point(p, rx, ry, rz) for p in ref]
+                xs, ys, zs = zip(*pts)
+                key = tuple(sorted((x - min(xs), y - min(ys), z - min(zs)) for x, y, z in pts))
+                if key not in seen:
+                    seen.add(key)
+                    triples.append((rx, ry, rz))
+    return triples
+
+
+_CANONICAL_24 = _canonical_rotations()
+
+
+# rotated+normalized bricks keyed on (cubes, rx, ry, rz); bricks never change
+# once loaded, so entries stay valid for the lifetime of the process
+_rot_cache: Dict[tuple, Brick] = {}
+
+
+def _rotated_norm(brick: Brick, rx: int, ry: int, rz: int) -> Brick:
+    """Cached equivalent of brick.rotated(rx, ry, rz).normalized()."""
+    key = (tuple(brick.cubes), rx, ry, rz)
+    b = _rot_cache.get(key)
+    if b is None:
+        b = _rot_cache[key] = brick.rotated(rx, ry, rz).normalized()
+    return b
+
+
+def _pack_mask(cells: np.ndarray) -> int:
+    """Pack a boolean (size,size,size) array into one int (same bit layout)."""
+    return int.from_bytes(np.packbits(cells.ravel(), bitorder='little').tobytes(), 'little')
+
+
+# the face-neighbor stencil, defined once instead of as tuple literals in loops
+_NEIGHBORS6 = np.array([[1, 0, 0], [-1, 0, 0], [0, 1, 0], [0, -1, 0], [0, 0, 1], [0, 0, -1]], dtype=np.int8)
+
+
+def _neighbor_mask(grid: np.ndarray) -> int:
+    """Mask of all cells that are (or are face-adjacent to) an occupied cell.
+
+    The dilation is one shifted OR per _NEIGHBORS6 offset, so grid boundaries
+    are handled by the slicing itself; no wrap-around masking is needed.
+    """
+    occ = grid != 0
+    adj = occ.copy()
+    for offs in _NEIGHBORS6:
+        dst = tuple(slice(1, None) if o == 1 else slice(None, -1) if o == -1 else slice(None) for o in offs)
+        src = tuple(slice(None, -1) if o == 1 else slice(1, None) if o == -1 else slice(None) for o in offs)
+        adj[dst] |= occ[src]
+    return _pack_mask(adj)
+
+
+def _brick_faces(brick: Brick, pos) -> list:
+    """Return the outer-shell face quads of `brick` placed at `pos`.
+
+    A face shared by two cubes of the same brick is interior and never
+    visible, so only faces whose neighbor cell is outside the brick are kept.
+    """
+    cubes = {tuple(c) for c in brick.cubes}
+    faces = []
+    for cx, cy, cz in brick.cubes:
+        x, y, z = pos[0] + cx, pos[1] + cy, pos[2] + cz
+        if (cx - 1, cy, cz) not in cubes:
+            faces.append([(x, y, z), (x, y + 1, z), (x, y + 1, z + 1), (x, y, z + 1)])
+        if (cx + 1, cy, cz) not in cubes:
+            faces.append([(x + 1, y, z), (x + 1, y + 1, z), (x + 1, y + 1, z + 1), (x + 1, y, z + 1)])
+        if (cx, cy - 1, cz) not in cubes:
+            faces.append([(x, y, z), (x + 1, y, z), (x + 1, y, z + 1), (x, y, z + 1)])
+        if (cx, cy + 1, cz) not in cubes:
+            faces.append([(x, y + 1, z), (x + 1, y + 1, z), (x + 1, y + 1, z + 1), (x, y + 1, z + 1)])
+        if (cx, cy, cz - 1) not in cubes:
+            faces.append([(x, y, z), (x + 1, y, z), (x + 1, y + 1, z), (x, y + 1, z)])
+        if (cx, cy, cz + 1) not in cubes:
+            faces.append([(x, y, z + 1), (x + 1, y, z + 1), (x + 1, y + 1, z + 1), (x, y + 1, z + 1)])
+    return faces
+
+
+def find_placements(grid: CubeGrid, brick: Brick, only_adjacent: bool = False,
+                    sampler=None, limit: int = None) -> List[Tuple[int, int, int, int, int, int]]:
+    """Return all placements (x,y,z,rx,ry,rz) of `brick` that fit the current grid.
+
+    Collision tests use 216-bit masks: the grid occupancy is packed into one int
+    and each rotated brick shape into another, so `can_place` collapses to a
+    single big-int AND instead of per-cube Python checks. If only_adjacent is
+    True, only placements touching at least one existing cube are returned.
+
+    If `sampler` is given it is called as sampler(placement, k) for the k-th
+    (1-based) valid placement instead of accumulating results, and an empty
+    list is returned — useful for reservoir sampling without building the full
+    list. `limit` stops the scan after that many valid placements.
+
+    When numba is installed and no sampler is in play, the enumeration runs in
+    a compiled kernel from `solver_numba` instead; results are identical.
+    """
+    size = grid.size
+    if find_placements_kernel is not None and sampler is None:
+        n_rot = len(_CANONICAL_24)
+        rot_cubes = np.empty((n_rot, 4, 3), dtype=np.int8)
+        rot_ids = np.empty((n_rot, 3), dtype=np.int8)
+        for i, (rx, ry, rz) in enumerate(_CANONICAL_24):
+            rot_cubes[i] = _rotated_norm(brick, rx, ry, rz).cubes_np
+            rot_ids[i] = (rx, ry, rz)
+        rows = find_placements_kernel(grid.grid, rot_cubes, rot_ids, size, only_adjacent)
+        if limit is not None:
+            rows = rows[:limit]
+        return [(int(x), int(y), int(z), int(rx), int(ry), int(rz)) for x, y, z, rx, ry, rz in rows]
+    occ = grid.occ  # CubeGrid keeps this bitboard in sync with grid.grid
+    adj = _neighbor_mask(grid.grid) if only_adjacent else 0
+    found = []
+    seen = set()
+    # bind method lookups once; inside the scan they run per candidate
+    seen_add = seen.add
+    found_append = found.append
+    k = 0
+    for rx, ry, rz in _CANONICAL_24:
+        b = _rotated_norm(brick, rx, ry, rz)
+        base = _cubes_mask(b.cubes, size)
+        xs, ys, zs = zip(*b.cubes)
+        ex, ey, ez = max(xs), max(ys), max(zs)
+        # anchors beyond these ranges would put the brick out of bounds
+        for x in range(size - ex):
+            for y in range(size - ey):
+                row_shift = (x * size + y) * size
+                for z in range(size - ez):
+                    placed = base << (row_shift + z)
+                    if placed & occ:
+                        continue
+                    # the placement mask itself identifies the occupied
+                    # cells, so it doubles as the dedup key (symmetric
+                    # bricks still repeat shapes across the 24 rotations)
+                    if placed in seen:
+                        continue
+                    seen_add(placed)
+                    if only_adjacent and not (placed & adj):
+                        continue
+                    k += 1
+                    if sampler is not None:
+                        sampler((x, y, z, rx, ry, rz), k)
+                    else:
+                        found_append((x, y, z, rx, ry, rz))
+                    if limit is not None and k >= limit:
+                        return found
+    return found
 
 
 class App(tk.Tk):
@@ -29,6 +206,13 @@ class App(tk.Tk):
         # model
         self.grid = CubeGrid(size=6)
         self.bricks = sample_bricks()
+        # worker for the placement scans so the Tk mainloop stays responsive
+        self._exec = ThreadPoolExecutor(max_workers=1)
+        # indicator scan results keyed on grid occupancy bytes; a place+undo
+        # round-trip then reuses the previous answer instead of rescanning
+        self._indicator_cache: 'OrderedDict[bytes, Tuple[int, bool]]' = OrderedDict()
+        # True while a list/draw/indicator refresh is queued on the idle loop
+        self._ui_dirty = False
 
         # UI layout: left controls, right canvas
         self.left = ttk.Frame(self)
@@ -84,11 +268,13 @@ class App(tk.Tk):
         ttk.Button(btn_frame, text='Remove selected', command=self.on_remove).pack(fill=tk.X, pady=(4, 0))
         ttk.Button(btn_frame, text='Reset', command=self.on_reset).pack(fill=tk.X, pady=(4, 0))
         ttk.Button(btn_frame, text='Demo', command=self.on_demo).pack(fill=tk.X, pady=(4, 0))
-        ttk.Button(btn_frame, text="Find T spaces", command=self.on_find_T).pack(fill=tk.X, pady=(4, 0))
+        self.find_t_btn = ttk.Button(btn_frame, text="Find T spaces", command=self.on_find_T)
+        self.find_t_btn.pack(fill=tk.X, pady=(4, 0))
         # option to only show placements that are adjacent to existing bricks
         self.only_adjacent_var = tk.BooleanVar(value=False)
         ttk.Checkbutton(btn_frame, text='Only adjacent', variable=self.only_adjacent_var).pack(anchor=tk.W, pady=(4,0))
-        ttk.Button(btn_frame, text='Add Random Adj T', command=self.on_add_random_adj_T).pack(fill=tk.X, pady=(4, 0))
+        self.add_adj_t_btn = ttk.Button(btn_frame, text='Add Random Adj T', command=self.on_add_random_adj_T)
+        self.add_adj_t_btn.pack(fill=tk.X, pady=(4, 0))
         # Save/Load
         ttk.Button(btn_frame, text='Save...', command=self.on_save).pack(fill=tk.X, pady=(6, 0))
         ttk.Button(btn_frame, text='Load...', command=self.on_load).pack(fill=tk.X, pady=(4, 0))
@@ -118,6 +304,18 @@ class App(tk.Tk):
         self.ax = self.fig.add_subplot(111, projection='3d')
         self.canvas = FigureCanvasTkAgg(self.fig, master=self.right)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        # colormap is fixed for the app's lifetime; look it up once
+        self._cmap = plt.get_cmap('tab20')
+        # incremental-redraw state: one artist per placed brick, plus the
+        # rendered background used for blitting newly placed bricks
+        self._artists_by_pid: Dict[int, Poly3DCollection] = {}
+        self._bg = None
+        # any full repaint (interactive axes rotation, window resize, ...)
+        # makes the snapshot stale; drop it so _draw_new_brick recaptures
+        self.canvas.mpl_connect('draw_event', self._on_canvas_draw)
+
+    def _on_canvas_draw(self, event):
+        self._bg = None
 
     def on_place(self):
         sel = self.brick_list.curselection()
@@ -135,14 +333,14 @@ class App(tk.Tk):
         except Exception:
             messagebox.showerror('Error', 'Invalid integer in inputs')
             return
-        b = self.bricks[bid].rotated(rx, ry, rz).normalized()
+        b = _rotated_norm(self.bricks[bid], rx, ry, rz)
         if not self.grid.can_place(b, (x, y, z)):
             messagebox.showwarning('Cannot place', 'Brick does not fit (out of bounds or overlap)')
             return
         try:
             pid = self.grid.place(b, (x, y, z))
             self._refresh_places_list()
-            self._draw()
+            self._draw_new_brick(pid)
             self._update_indicator()
         except Exception as e:
             messagebox.showerror('Error', str(e))
@@ -152,14 +350,12 @@ class App(tk.Tk):
         if not sel:
             messagebox.showinfo('Info', 'Select a placed brick to remove')
             return
-        text = self.placed_list.get(sel[0])
-        # format is "{pid}: {name} at (x,y,z)"
-        pid = int(text.split(':', 1)[0])
+        pid = self._placed_pids[sel[0]]
+        if pid not in self.grid.placed:
+            return  # already removed by an earlier queued event
         try:
             self.grid.remove(pid)
-            self._refresh_places_list()
-            self._draw()
-            self._update_indicator()
+            self._schedule_refresh()
         except Exception as e:
             messagebox.showerror('Error', str(e))
 
@@ -168,15 +364,15 @@ class App(tk.Tk):
         if not sel:
             messagebox.showinfo('Info', 'Select a placed brick to move')
             return
-        text = self.placed_list.get(sel[0])
-        pid = int(text.split(':', 1)[0])
+        pid = self._placed_pids[sel[0]]
+        entry = self.grid.placed.get(pid)
+        if entry is None:
+            return  # already removed by an earlier queued event
+        _, pos = entry  # current position, never the one from a pending refresh
         try:
-            _, brick, pos = self.grid.placed[pid]
             new_pos = (pos[0] + delta[0], pos[1] + delta[1], pos[2] + delta[2])
             self.grid.move(pid, new_pos)
-            self._refresh_places_list()
-            self._draw()
-            self._update_indicator()
+            self._schedule_refresh()
         except Exception as e:
             messagebox.showerror('Error', str(e))
 
@@ -187,78 +383,31 @@ class App(tk.Tk):
         """
         if bid not in self.bricks:
             return []
-        b0 = self.bricks[bid]
-        found = []
-        seen = set()
-        size = self.grid.size
-        for rx in range(4):
-            for ry in range(4):
-                for rz in range(4):
-                    b = b0.rotated(rx, ry, rz).normalized()
-                    for x in range(size):
-                        for y in range(size):
-                            for z in range(size):
-                                if self.grid.can_place(b, (x, y, z)):
-                                    occ = tuple(sorted(((x + cx, y + cy, z + cz) for cx, cy, cz in b.cubes)))
-                                    if occ in seen:
-                                        continue
-                                    seen.add(occ)
-                                    if only_adjacent:
-                                        touches = False
-                                        for cx, cy, cz in b.cubes:
-                                            nx, ny, nz = x + cx, y + cy, z + cz
-                                            for dx, dy, dz in ((1,0,0),(-1,0,0),(0,1,0),(0,-1,0),(0,0,1),(0,0,-1)):
-                                                sx, sy, sz = nx + dx, ny + dy, nz + dz
-                                                if 0 <= sx < size and 0 <= sy < size and 0 <= sz < size:
-                                                    if self.grid.grid[sx, sy, sz] != 0:
-                                                        touches = True
-                                                        break
-                                            if touches:
-                                                break
-                                        if not touches:
-                                            continue
-                                    found.append((x, y, z, rx, ry, rz))
-        return found
+        return find_placements(self.grid, self.bricks[bid], only_adjacent)
 
     def on_find_T(self):
-        """Find available placements for the 'T' brick and show them in a popup list."""
+        """Find available placements for the 'T' brick and show them in a popup list.
+
+        The scan runs on a worker thread so the mainloop stays responsive; the
+        popup is built back on the Tk thread once results are in.
+        """
         bid = 'T'
         if bid not in self.bricks:
             messagebox.showinfo('Info', "No 'T' brick is defined")
             return
-        b0 = self.bricks[bid]
-        found = []
-        seen = set()
-        size = self.grid.size
-        for rx in range(4):
-            for ry in range(4):
-                for rz in range(4):
-                    b = b0.rotated(rx, ry, rz).normalized()
-                    for x in range(size):
-                        for y in range(size):
-                            for z in range(size):
-                                if self.grid.can_place(b, (x, y, z)):
-                                    # dedupe by absolute occupied coordinates
-                                    occ = tuple(sorted(((x + cx, y + cy, z + cz) for cx, cy, cz in b.cubes)))
-                                    if occ in seen:
-                                        continue
-                                    seen.add(occ)
-                                    # if only-adjacent filter is on, ensure at least one cube touches existing brick
-                                    if self.only_adjacent_var.get():
-                                        touches = False
-                                        for cx, cy, cz in b.cubes:
-                                            nx, ny, nz = x + cx, y + cy, z + cz
-                                            for dx, dy, dz in ((1,0,0),(-1,0,0),(0,1,0),(0,-1,0),(0,0,1),(0,0,-1)):
-                                                sx, sy, sz = nx + dx, ny + dy, nz + dz
-                                                if 0 <= sx < size and 0 <= sy < size and 0 <= sz < size:
-                                                    if self.grid.grid[sx, sy, sz] != 0:
-                                                        touches = True
-                                                        break
-                                            if touches:
-                                                break
-                                        if not touches:
-                                            continue
-                                    found.append((x, y, z, rx, ry, rz))
+        self.find_t_btn.config(state=tk.DISABLED)
+        fut = self._exec.submit(self._find_placements, bid, self.only_adjacent_var.get())
+        fut.add_done_callback(lambda f: self.after(0, self._show_T_results, f))
+
+    def _show_T_results(self, fut):
+        """Show the finished T-placement scan in a popup (runs on the Tk thread)."""
+        self.find_t_btn.config(state=tk.NORMAL)
+        try:
+            found = fut.result()
+        except Exception as e:
+            messagebox.showerror('Error', str(e))
+            return
+        b0 = self.bricks['T']
 
         # show results in a popup
         win = tk.Toplevel(self)
@@ -270,46 +419,69 @@ class App(tk.Tk):
             listbox.insert(tk.END, f"pos=({x},{y},{z}) rot=({rx},{ry},{rz})")
         if not found:
             listbox.insert(tk.END, "(no placements found)")
-        # optional: allow double-click to place a selected placement
+        # optional: allow double-click to place a selected placement; the
+        # selection index maps straight into `found`, no string parsing
         def on_double(event):
             sel = listbox.curselection()
-            if not sel:
+            if not sel or not found:
                 return
-            item = listbox.get(sel[0])
-            if item.startswith('pos='):
-                # parse
-                try:
-                    part = item.split(' ', 1)[0]
-                    coords = part[len('pos=('):-1]
-                    x, y, z = [int(p) for p in coords.split(',')]
-                    rotpart = item.split('rot=(')[1][:-1]
-                    rx, ry, rz = [int(p) for p in rotpart.split(',')]
-                    b = b0.rotated(rx, ry, rz).normalized()
-                    if self.grid.can_place(b, (x, y, z)):
-                        self.grid.place(b, (x, y, z))
-                        self._refresh_places_list()
-                        self._draw()
-                        win.destroy()
-                    else:
-                        messagebox.showwarning('Cannot place', 'That placement is no longer valid')
-                except Exception as e:
-                    messagebox.showerror('Error', str(e))
+            try:
+                x, y, z, rx, ry, rz = found[sel[0]]
+                b = _rotated_norm(b0, rx, ry, rz)
+                if self.grid.can_place(b, (x, y, z)):
+                    pid = self.grid.place(b, (x, y, z))
+                    self._refresh_places_list()
+                    self._draw_new_brick(pid)
+                    win.destroy()
+                else:
+                    messagebox.showwarning('Cannot place', 'That placement is no longer valid')
+            except Exception as e:
+                messagebox.showerror('Error', str(e))
 
         listbox.bind('<Double-1>', on_double)
 
     def on_add_random_adj_T(self):
-        """Find all adjacent T placements and add one at random."""
-        placements = self._find_placements('T', only_adjacent=True)
+        """Pick a uniformly random adjacent T placement and add it.
+
+        Like on_find_T, the scan runs on the worker thread; the placement
+        itself happens back on the Tk thread.
+        """
+        self.add_adj_t_btn.config(state=tk.DISABLED)
+        fut = self._exec.submit(self._random_adjacent_T)
+        fut.add_done_callback(lambda f: self.after(0, self._finish_add_random_adj_T, f))
+
+    def _random_adjacent_T(self):
+        """Reservoir-sample one adjacent T placement without keeping the full list.
+
+        Keeping the k-th valid placement with probability 1/k yields a uniform
+        choice over all of them while storing only one candidate.
+        """
+        reservoir = []
+
+        def sampler(cand, k):
+            if random.randrange(k) == 0:
+                reservoir[:] = [cand]
+
+        find_placements(self.grid, self.bricks['T'], only_adjacent=True, sampler=sampler)
+        return reservoir
+
+    def _finish_add_random_adj_T(self, fut):
+        self.add_adj_t_btn.config(state=tk.NORMAL)
+        try:
+            placements = fut.result()
+        except Exception as e:
+            messagebox.showerror('Error', str(e))
+            return
         if not placements:
             messagebox.showinfo('Info', 'No adjacent T placements available')
             return
-        x, y, z, rx, ry, rz = random.choice(placements)
+        x, y, z, rx, ry, rz = placements[0]
         b0 = self.bricks['T']
-        b = b0.rotated(rx, ry, rz).normalized()
+        b = _rotated_norm(b0, rx, ry, rz)
         try:
-            self.grid.place(b, (x, y, z))
+            pid = self.grid.place(b, (x, y, z))
             self._refresh_places_list()
-            self._draw()
+            self._draw_new_brick(pid)
             self._update_indicator()
         except Exception as e:
             messagebox.showerror('Error', str(e))
@@ -341,9 +513,7 @@ class App(tk.Tk):
             return
         try:
             self.grid.load_from_file(path)
-            self._refresh_places_list()
-            self._draw()
-            self._update_indicator()
+            self._schedule_refresh()
         except Exception as e:
             messagebox.showerror('Error', str(e))
 
@@ -352,9 +522,7 @@ class App(tk.Tk):
     def on_reset(self):
         if messagebox.askyesno('Reset', 'Clear the grid?'):
             self.grid.clear()
-            self._refresh_places_list()
-            self._draw()
-            self._update_indicator()
+            self._schedule_refresh()
 
     def on_demo(self):
         # place a few sample bricks if they fit
@@ -362,37 +530,74 @@ class App(tk.Tk):
         b = self.bricks
         try:
             self.grid.place(b['O'], (0, 0, 0))
-            self.grid.place(b['I'].rotated(0, 0, 1).normalized(), (0, 2, 0))
-            self.grid.place(b['L'].rotated(0, 1, 0).normalized(), (3, 0, 0))
+            self.grid.place(_rotated_norm(b['I'], 0, 0, 1), (0, 2, 0))
+            self.grid.place(_rotated_norm(b['L'], 0, 1, 0), (3, 0, 0))
         except Exception:
             pass
+        self._schedule_refresh()
+
+    def _schedule_refresh(self):
+        """Queue a places-list/draw/indicator refresh on the next idle cycle.
+
+        Rapid clicks (e.g. holding a move button) then collapse into a single
+        full redraw and T scan instead of one per event.
+        """
+        if self._ui_dirty:
+            return
+        self._ui_dirty = True
+        self.after_idle(self._do_refresh)
+
+    def _do_refresh(self):
+        self._ui_dirty = False
         self._refresh_places_list()
         self._draw()
         self._update_indicator()
 
     def _refresh_places_list(self):
         self.placed_list.delete(0, tk.END)
-        for pid, (pid2, brick, pos) in sorted(self.grid.placed.items()):
+        # listbox row i describes _placed_pids[i]; only the id is kept here —
+        # brick and position are read from grid.placed at call time, so
+        # debounced refreshes can never hand out stale coordinates
+        self._placed_pids = []
+        for pid, (brick, pos) in sorted(self.grid.placed.items()):
             self.placed_list.insert(tk.END, f"{pid}: {brick.name} at {pos}")
+            self._placed_pids.append(pid)
+
+    def _draw_new_brick(self, pid):
+        """Draw only the newly placed brick `pid` by blitting its artist.
+
+        Avoids rebuilding the whole voxel scene on placement; removals, moves
+        and loads still go through the full `_draw` path.
+        """
+        if self._bg is None:
+            # no usable background yet (first paint, or after a full redraw
+            # that is still pending); render and snapshot it now
+            self.canvas.draw()
+            self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        brick, pos = self.grid.placed[pid]
+        unique_ids = sorted(self.grid.placed)
+        color = self._cmap(unique_ids.index(pid) % 20)
+        art = Poly3DCollection(_brick_faces(brick, pos), facecolors=color, edgecolor='k')
+        self.ax.add_collection3d(art)
+        self._artists_by_pid[pid] = art
+        self.canvas.restore_region(self._bg)
+        self.ax.draw_artist(art)
+        self.canvas.blit(self.ax.bbox)
+        # the new brick is part of the background for the next placement
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
 
     def _draw(self):
         self.ax.clear()
-        filled = self.grid.grid != 0
-        if filled.any():
-            unique_ids = list(sorted(set(self.grid.grid[self.grid.grid != 0].tolist())))
-            cmap = plt.get_cmap('tab20')
-            colors = {pid: cmap(i % 20) for i, pid in enumerate(unique_ids)}
-            facecolors = [[[ (0,0,0,0) for _ in range(self.grid.size)] for __ in range(self.grid.size)] for ___ in range(self.grid.size)]
-            import numpy as _np
-            facearr = _np.empty(filled.shape + (4,), dtype=float)
-            facearr[:] = (0, 0, 0, 0)
-            for x in range(self.grid.size):
-                for y in range(self.grid.size):
-                    for z in range(self.grid.size):
-                        pid = self.grid.grid[x, y, z]
-                        if pid != 0:
-                            facearr[x, y, z] = colors.get(pid, (0.5, 0.5, 0.5, 1.0))
-            self.ax.voxels(filled, facecolors=facearr, edgecolor='k')
+        # a full redraw discards the per-brick artists and the blit background
+        self._artists_by_pid.clear()
+        self._bg = None
+        # one outer-shell collection per placed brick: rebuild cost scales with
+        # the number of bricks, not with size^3 as ax.voxels did
+        for i, pid in enumerate(sorted(self.grid.placed)):
+            brick, pos = self.grid.placed[pid]
+            art = Poly3DCollection(_brick_faces(brick, pos), facecolors=self._cmap(i % 20), edgecolor='k')
+            self.ax.add_collection3d(art)
+            self._artists_by_pid[pid] = art
         # Always set the axes limits to show the full 6x6x6 grid
         self.ax.set_xlim(0, self.grid.size)
         self.ax.set_ylim(0, self.grid.size)
@@ -401,7 +606,8 @@ class App(tk.Tk):
         self.ax.set_ylabel('Y')
         self.ax.set_zlabel('Z')
         self.fig.tight_layout()
-        self.canvas.draw()
+        # draw_idle lets Tk coalesce several queued redraws into one repaint
+        self.canvas.draw_idle()
 
     def _update_indicator(self):
         """Update the `t_indicator` label to show whether a 'T' can be placed between existing bricks."""
@@ -412,12 +618,22 @@ class App(tk.Tk):
         if num == 0:
             self.t_indicator.config(text="Complete !!!", fg='green')
             return
-        valids = self.grid.validate_placements(self.bricks['T'])
-        possible = not self.grid.can_not_place_somewhere(self.bricks['T'])
+        key = self.grid.grid.tobytes()
+        hit = self._indicator_cache.get(key)
+        if hit is None:
+            valids = self.grid.validate_placements(self.bricks['T'])
+            possible = not self.grid.can_not_place_somewhere(self.bricks['T'])
+            hit = (len(valids), possible)
+            self._indicator_cache[key] = hit
+            if len(self._indicator_cache) > 64:
+                self._indicator_cache.popitem(last=False)
+        else:
+            self._indicator_cache.move_to_end(key)
+        n_valids, possible = hit
         if possible:
-            self.t_indicator.config(text=f"{num}:{len(valids)}: T's: YES", fg='green')
+            self.t_indicator.config(text=f"{num}:{n_valids}: T's: YES", fg='green')
         else:
-            self.t_indicator.config(text=f"{num}:{len(valids)}: T's: NO", fg='red')
+            self.t_indicator.config(text=f"{num}:{n_valids}: T's: NO", fg='red')
 
 
 def main():
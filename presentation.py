@@ -16,6 +16,7 @@ Bricks are defined as sets of 4 integer cube coordinates relative to (0,0,0).
 """
 from __future__ import annotations
 import sys
+from functools import lru_cache
 from typing import List, Tuple, Dict
 import json
 import numpy as np
@@ -27,52 +28,134 @@ except Exception as e:  # pragma: no cover - helpful error if deps missing
     print("matplotlib is required to run this script. Install with: pip install -r requirements.txt")
     raise
 
+# optional compiled kernel for placement enumeration; the numpy path below
+# is the fallback when numba is not installed
+try:
+    from solver_numba import validate_placements_kernel
+except Exception:
+    validate_placements_kernel = None
+
 Coord = Tuple[int, int, int]
 
 
-def rotate_point(p: Coord, rx: int, ry: int, rz: int) -> Coord:
-    """Rotate point p by rx, ry, rz steps (each step = 90 degrees) around X, Y, Z axes about the origin.
+# the three 90-degree axis generators: X (x,y,z)->(x,-z,y), Y ->(z,y,-x), Z ->(-y,x,z)
+_GEN_X = np.array([[1, 0, 0], [0, 0, -1], [0, 1, 0]], dtype=np.int8)
+_GEN_Y = np.array([[0, 0, 1], [0, 1, 0], [-1, 0, 0]], dtype=np.int8)
+_GEN_Z = np.array([[0, -1, 0], [1, 0, 0], [0, 0, 1]], dtype=np.int8)
 
-    rx, ry, rz are integers (can be negative); rotation is applied X, then Y, then Z.
+
+def _rotation_matrices_24() -> np.ndarray:
+    """Return the 24 proper rotations of the cube as a (24, 3, 3) int8 array.
+
+    Built once at import by composing the three 90-degree axis generators and
+    deduplicating; entries are all 0/+-1 so int8 is exact.
     """
-    x, y, z = p
+    gen_x, gen_y, gen_z = _GEN_X, _GEN_Y, _GEN_Z
+    seen = {}
+    frontier = [np.eye(3, dtype=np.int8)]
+    while frontier:
+        m = frontier.pop()
+        key = m.tobytes()
+        if key in seen:
+            continue
+        seen[key] = m
+        for g in (gen_x, gen_y, gen_z):
+            frontier.append((g @ m).astype(np.int8))
+    mats = np.stack(sorted(seen.values(), key=lambda m: tuple(m.flatten())))
+    assert len(mats) == 24
+    return mats
+
+
+_ROT24 = _rotation_matrices_24()
+
+
+def _build_rot_lut() -> Dict[Tuple[int, int, int], tuple]:
+    """Map every (rx%4, ry%4, rz%4) step triple to its composed 3x3 matrix.
+
+    The composition X-then-Y-then-Z is evaluated once per triple at import;
+    matrices are plain int tuples so rotate_point applies them without numpy
+    overhead.
+    """
+    lut = {}
+    for rx in range(4):
+        for ry in range(4):
+            for rz in range(4):
+                m = np.eye(3, dtype=np.int8)
+                for gen, steps in ((_GEN_X, rx), (_GEN_Y, ry), (_GEN_Z, rz)):
+                    for _ in range(steps):
+                        m = gen @ m
+                lut[(rx, ry, rz)] = tuple(tuple(int(v) for v in row) for row in m)
+    return lut
 
-    def rot_x(a):
-        # (x, y, z) -> (x, -z, y)
-        return (a[0], -a[2], a[1])
 
-    def rot_y(a):
-        # (x, y, z) -> (z, y, -x)
-        return (a[2], a[1], -a[0])
+_ROT_LUT = _build_rot_lut()
 
-    def rot_z(a):
-        # (x, y, z) -> (-y, x, z)
-        return (-a[1], a[0], a[2])
 
-    a = (x, y, z)
-    for _ in range(rx % 4):
-        a = rot_x(a)
-    for _ in range(ry % 4):
-        a = rot_y(a)
-    for _ in range(rz % 4):
-        a = rot_z(a)
-    return a
+def rotate_point(p: Coord, rx: int, ry: int, rz: int) -> Coord:
+    """Rotate point p by rx, ry, rz steps (each step = 90 degrees) around X, Y, Z axes about the origin.
+
+    rx, ry, rz are integers (can be negative); rotation is applied X, then Y, then Z.
+    """
+    x, y, z = p
+    m = _ROT_LUT[(rx % 4, ry % 4, rz % 4)]
+    return (m[0][0] * x + m[0][1] * y + m[0][2] * z,
+            m[1][0] * x + m[1][1] * y + m[1][2] * z,
+            m[2][0] * x + m[2][1] * y + m[2][2] * z)
 
 
 class Brick:
     """A brick is a set of 4 cube coordinates relative to an origin.
 
-    Example shapes are provided in `sample_bricks()`.
+    Bricks are immutable once constructed, so instances can be shared,
+    hashed and cached freely. Example shapes are provided in `sample_bricks()`.
     """
 
+    __slots__ = ('cubes', 'name', '_cubes_np', '_min', '_max', '_hash')
+
     def __init__(self, cubes: List[Coord], name: str = ""):
         if len(cubes) != 4:
             raise ValueError("Each brick must consist of exactly 4 cubes")
-        self.cubes = list(cubes)
-        self.name = name or "brick"        
+        self.cubes = tuple(tuple(c) for c in cubes)
+        self.name = name or "brick"
+        self._cubes_np = None
+        xs, ys, zs = zip(*self.cubes)
+        # bounding box, so placement tests can reject out-of-grid positions
+        # with six comparisons instead of checking every cube
+        self._min = (min(xs), min(ys), min(zs))
+        self._max = (max(xs), max(ys), max(zs))
+        self._hash = hash(frozenset(self.cubes))
+
+    def __eq__(self, other) -> bool:
+        # bricks are equal by shape (cube order is irrelevant), so sets of
+        # rotations deduplicate to the truly distinct orientations
+        return isinstance(other, Brick) and frozenset(self.cubes) == frozenset(other.cubes)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    @property
+    def cubes_np(self) -> np.ndarray:
+        """The cubes as a C-contiguous (N,3) int8 array, built lazily and cached.
+
+        Vectorized callers index this instead of unpacking the tuple list.
+        """
+        if self._cubes_np is None:
+            self._cubes_np = np.ascontiguousarray(self.cubes, dtype=np.int8)
+        return self._cubes_np
+
+    def unique_rotations(self) -> List["Brick"]:
+        """Return this brick under all 24 proper cube rotations, normalized to the origin.
+
+        One einsum over the `_ROT24` matrix table replaces the 4x4x4
+        `rotated(rx, ry, rz)` sweep, which only ever produced these 24 shapes.
+        """
+        rots = np.einsum('rij,cj->rci', _ROT24, self.cubes_np)
+        rots -= rots.min(axis=1, keepdims=True)
+        return [Brick([tuple(int(v) for v in c) for c in r], name=self.name) for r in rots]
 
     def rotated(self, rx: int, ry: int, rz: int) -> "Brick":
-        return Brick([rotate_point(c, rx, ry, rz) for c in self.cubes], name=self.name)
+        # steps are taken mod 4 so equivalent rotations share a cache entry
+        return _rotated_impl(self.cubes, rx % 4, ry % 4, rz % 4, self.name)
 
     def normalized(self) -> "Brick":
         # shift so min coord is at origin
@@ -81,100 +164,157 @@ class Brick:
         return Brick([(x - minx, y - miny, z - minz) for x, y, z in self.cubes], name=self.name)
 
 
+@lru_cache(maxsize=None)
+def _rotated_impl(cubes: tuple, rx: int, ry: int, rz: int, name: str) -> Brick:
+    """Memoized body of Brick.rotated: only 24 distinct results exist per
+    shape, so repeat rotations become a dict lookup. Safe because bricks are
+    immutable."""
+    return Brick([rotate_point(c, rx, ry, rz) for c in cubes], name=name)
+
+
+# the brick catalogue, defined once and shared by CubeGrid and sample_bricks()
+_BRICK_TEMPLATES = {
+    # T-shape
+    'T': Brick([(0, 0, 0), (1, 0, 0), (2, 0, 0), (1, 1, 0)], name='T'),
+    # straight line of 4
+    'I': Brick([(0, 0, 0), (1, 0, 0), (2, 0, 0), (3, 0, 0)], name='I'),
+    # L-shape: 3 in a line + one attached at end
+    'L': Brick([(0, 0, 0), (1, 0, 0), (2, 0, 0), (2, 1, 0)], name='L'),
+    # square 2x2 (flat)
+    'O': Brick([(0, 0, 0), (1, 0, 0), (0, 1, 0), (1, 1, 0)], name='O'),
+    # a small 3D hook
+    'S3D': Brick([(0, 0, 0), (1, 0, 0), (1, 1, 0), (1, 1, 1)], name='S3D')
+}
+
+
+def _brick_mask(brick: Brick, pos: Coord, size: int) -> int:
+    """Pack the absolute cells of `brick` placed at `pos` into one occupancy int.
+
+    Bit index is the C-order flat index (x*size + y)*size + z, so masks from
+    different bricks can be combined with plain integer AND/OR.
+    """
+    px, py, pz = pos
+    mask = 0
+    for cx, cy, cz in brick.cubes:
+        mask |= 1 << (((px + cx) * size + py + cy) * size + pz + cz)
+    return mask
+
+
 class CubeGrid:
     def __init__(self, size: int = 6):
         self.size = size
-        self.grid = np.zeros((size, size, size), dtype=int)  # 0 = empty, >0 = brick id
+        self.grid = np.zeros((size, size, size), dtype=np.uint8)  # 0 = empty, >0 = brick id
+        self.occ = 0  # bitboard of occupied cells, kept in sync with self.grid
+        self._empty_mask = np.ones((size, size, size), dtype=bool)  # grid == 0, updated in place
         self.next_id = 1
-        self.placed: Dict[int, Tuple[int, Brick, Coord]] = {}  # id -> (placement_id, brick, position)
-        self.bricks = {
-            # T-shape
-            'T': Brick([(0, 0, 0), (1, 0, 0), (2, 0, 0), (1, 1, 0)], name='T'),
-            # straight line of 4
-            'I': Brick([(0, 0, 0), (1, 0, 0), (2, 0, 0), (3, 0, 0)], name='I'),
-            # L-shape: 3 in a line + one attached at end
-            'L': Brick([(0, 0, 0), (1, 0, 0), (2, 0, 0), (2, 1, 0)], name='L'),
-            # square 2x2 (flat)
-            'O': Brick([(0, 0, 0), (1, 0, 0), (0, 1, 0), (1, 1, 0)], name='O'),
-            # a small 3D hook
-            'S3D': Brick([(0, 0, 0), (1, 0, 0), (1, 1, 0), (1, 1, 1)], name='S3D')
-        } 
-        self.valid_placements = {
-            'T': set(),
-            'I': set(),
-            'L': set(),
-            'O': set(),
-            'S3D': set()
-        }
-        self.valid_brick_rotations = {
-            'T': set(),
-            'I': set(),
-            'L': set(),
-            'O': set(),
-            'S3D': set()
-        }
-        
+        self.placed: Dict[int, Tuple[Brick, Coord]] = {}  # id -> (brick, position)
+        self.bricks = _BRICK_TEMPLATES  # shared catalogue; bricks are never mutated
+        self.valid_placements: Dict[str, set] = {}
+        # per brick: the distinct rotations as a deterministic, first-seen-
+        # ordered list, plus the same shapes stacked as an (R,4,3) int8 array
+        # whose rows line up with that list
+        self.valid_brick_rotations: Dict[str, List[Brick]] = {}
+        self._rot_cubes: Dict[str, np.ndarray] = {}
+        # exclusive per-axis anchor bound for each rotation: anchors in
+        # [0, limit) keep that rotation fully inside the grid
+        self._anchor_limits: Dict[str, np.ndarray] = {}
+        # every in-bounds (rotation, anchor) placement, precomputed once:
+        # _placement_masks rows are the placement's occupancy mask split into
+        # little-endian uint64 words (anchor-cell bit included), and
+        # _placement_rows holds the matching (rot_idx, x, y, z)
+        self._occ_words = (size ** 3 + 63) // 64
+        self._placement_masks: Dict[str, np.ndarray] = {}
+        self._placement_rows: Dict[str, np.ndarray] = {}
+        # per brick: valid_placements as a boolean grid, and each placement
+        # row's anchor as a flat cell index, for grouping rows by anchor
+        self._valid_placement_mask: Dict[str, np.ndarray] = {}
+        self._anchor_flat: Dict[str, np.ndarray] = {}
+
         for brick in self.bricks.values():
-            all_rotations = set()
-            for rx in range(4):
-                for ry in range(4):
-                    for rz in range(4):
-                        b = brick.rotated(rx, ry, rz).normalized()
-                        all_rotations.add(b)
-            self.valid_brick_rotations[brick.name] = all_rotations
-
-            for x in range(self.size):
-                for y in range(self.size):
-                    for z in range(self.size):
-                        ok_place = False
-                        for b in all_rotations:
-                            if self.can_place(b, (x, y, z)):
-                                ok_place = True
-                                break
-                        if ok_place:
-                            self.valid_placements[brick.name].add((x, y, z))
-    
-    def bricks(self) -> Dict[str, Brick]:
-        return self.bricks
-    
+            seen = set()
+            rots = []
+            for b in brick.unique_rotations():
+                key = frozenset(b.cubes)
+                if key not in seen:
+                    seen.add(key)
+                    rots.append(b)
+            self.valid_brick_rotations[brick.name] = rots
+            cubes = np.stack([b.cubes_np for b in rots])
+            self._rot_cubes[brick.name] = cubes
+
+            # the grid is empty here, so a rotation fits at an anchor exactly
+            # when its bounding box does: the valid anchors per rotation form
+            # a (size-ex, size-ey, size-ez) sub-box, no per-cell scan needed
+            limits = self.size - cubes.max(axis=1)
+            self._anchor_limits[brick.name] = limits
+            valid = np.zeros((self.size, self.size, self.size), dtype=bool)
+            for lx, ly, lz in limits:
+                valid[:lx, :ly, :lz] = True
+            self.valid_placements[brick.name] = {(int(x), int(y), int(z)) for x, y, z in np.argwhere(valid)}
+            self._valid_placement_mask[brick.name] = valid
+
+            nbytes = self._occ_words * 8
+            rows = []
+            words = []
+            for r, (lx, ly, lz) in enumerate(limits):
+                for x in range(lx):
+                    for y in range(ly):
+                        for z in range(lz):
+                            m = _brick_mask(rots[r], (x, y, z), self.size)
+                            # keep the anchor-cell-empty requirement in the mask
+                            m |= 1 << ((x * self.size + y) * self.size + z)
+                            rows.append((r, x, y, z))
+                            words.append(np.frombuffer(m.to_bytes(nbytes, 'little'), dtype=np.uint64))
+            rows_arr = np.array(rows, dtype=np.int32)
+            self._placement_rows[brick.name] = rows_arr
+            self._placement_masks[brick.name] = np.stack(words)
+            self._anchor_flat[brick.name] = (rows_arr[:, 1] * self.size + rows_arr[:, 2]) * self.size + rows_arr[:, 3]
+
     def clear(self):
         self.grid.fill(0)
+        self.occ = 0
+        self._empty_mask.fill(True)
         self.next_id = 1
         self.placed.clear()
 
     def can_place(self, brick: Brick, pos: Coord) -> bool:
-        for cx, cy, cz in brick.cubes:
-            x, y, z = pos[0] + cx, pos[1] + cy, pos[2] + cz
-            if not (0 <= x < self.size and 0 <= y < self.size and 0 <= z < self.size):
-                return False
-            if self.grid[x, y, z] != 0:
-                return False
-        return True
+        size = self.size
+        px, py, pz = pos
+        bmin, bmax = brick._min, brick._max
+        if not (0 <= px + bmin[0] and px + bmax[0] < size
+                and 0 <= py + bmin[1] and py + bmax[1] < size
+                and 0 <= pz + bmin[2] and pz + bmax[2] < size):
+            return False
+        # one integer AND against the bitboard replaces per-cell grid reads
+        return (self.occ & _brick_mask(brick, pos, size)) == 0
 
     def place(self, brick: Brick, pos: Coord) -> int:
         """Place brick at pos if fits. Returns placement id or raises ValueError."""
         if not self.can_place(brick, pos):
             raise ValueError("Brick does not fit at position or overlaps")
         pid = self.next_id
-        for cx, cy, cz in brick.cubes:
-            x, y, z = pos[0] + cx, pos[1] + cy, pos[2] + cz
-            self.grid[x, y, z] = pid
-        self.placed[pid] = (pid, brick, pos)
+        assert pid < 256, "placement id would overflow the uint8 grid"
+        cells = brick.cubes_np + np.asarray(pos, dtype=np.int8)
+        self.grid[cells[:, 0], cells[:, 1], cells[:, 2]] = pid
+        self._empty_mask[cells[:, 0], cells[:, 1], cells[:, 2]] = False
+        self.occ |= _brick_mask(brick, pos, self.size)
+        self.placed[pid] = (brick, pos)
         self.next_id += 1
         return pid
 
     def remove(self, placement_id: int) -> None:
         if placement_id not in self.placed:
             raise KeyError("placement id not found")
-        pid, brick, pos = self.placed.pop(placement_id)
-        for cx, cy, cz in brick.cubes:
-            x, y, z = pos[0] + cx, pos[1] + cy, pos[2] + cz
-            self.grid[x, y, z] = 0
+        brick, pos = self.placed.pop(placement_id)
+        cells = brick.cubes_np + np.asarray(pos, dtype=np.int8)
+        self.grid[cells[:, 0], cells[:, 1], cells[:, 2]] = 0
+        self._empty_mask[cells[:, 0], cells[:, 1], cells[:, 2]] = True
+        self.occ &= ~_brick_mask(brick, pos, self.size)
 
     def to_dict(self) -> Dict:
         """Serialize the CubeGrid to a JSON-serializable dict."""
         placed = []
-        for pid, (pid2, brick, pos) in self.placed.items():
+        for pid, (brick, pos) in self.placed.items():
             placed.append({
                 'pid': pid,
                 'name': brick.name,
@@ -199,7 +339,9 @@ class CubeGrid:
         size = int(data.get('size', 6))
         # reinitialize grid
         self.size = size
-        self.grid = np.zeros((size, size, size), dtype=int)
+        self.grid = np.zeros((size, size, size), dtype=np.uint8)
+        self.occ = 0
+        self._empty_mask = np.ones((size, size, size), dtype=bool)
         self.placed = {}
         max_pid = 0
         for item in data.get('placed', []):
@@ -209,10 +351,11 @@ class CubeGrid:
             pos = tuple(int(p) for p in item['pos'])
             brick = Brick(cubes, name=name)
             # set grid cells
-            for cx, cy, cz in brick.cubes:
-                x, y, z = pos[0] + cx, pos[1] + cy, pos[2] + cz
-                self.grid[x, y, z] = pid
-            self.placed[pid] = (pid, brick, pos)
+            cells = brick.cubes_np + np.asarray(pos, dtype=np.int8)
+            self.grid[cells[:, 0], cells[:, 1], cells[:, 2]] = pid
+            self._empty_mask[cells[:, 0], cells[:, 1], cells[:, 2]] = False
+            self.occ |= _brick_mask(brick, pos, size)
+            self.placed[pid] = (brick, pos)
             if pid > max_pid:
                 max_pid = pid
         self.next_id = int(data.get('next_id', max_pid + 1))
@@ -225,15 +368,16 @@ class CubeGrid:
         """
         if placement_id not in self.placed:
             return False
-        _, brick, _ = self.placed[placement_id]
-        for cx, cy, cz in brick.cubes:
-            x, y, z = new_pos[0] + cx, new_pos[1] + cy, new_pos[2] + cz
-            if not (0 <= x < self.size and 0 <= y < self.size and 0 <= z < self.size):
-                return False
-            occ = self.grid[x, y, z]
-            if occ != 0 and occ != placement_id:
-                return False
-        return True
+        brick, old_pos = self.placed[placement_id]
+        size = self.size
+        px, py, pz = new_pos
+        bmin, bmax = brick._min, brick._max
+        if not (0 <= px + bmin[0] and px + bmax[0] < size
+                and 0 <= py + bmin[1] and py + bmax[1] < size
+                and 0 <= pz + bmin[2] and pz + bmax[2] < size):
+            return False
+        # mask out the brick's own cells so it may slide over itself
+        return (self.occ & ~_brick_mask(brick, old_pos, size) & _brick_mask(brick, new_pos, size)) == 0
 
     def move(self, placement_id: int, new_pos: Coord) -> None:
         """Move the placed brick to new_pos if possible; raises ValueError on failure."""
@@ -241,93 +385,113 @@ class CubeGrid:
             raise KeyError("placement id not found")
         if not self.can_move(placement_id, new_pos):
             raise ValueError("cannot move to the requested position (out of bounds or overlap)")
-        pid, brick, old_pos = self.placed[placement_id]
-        # clear old positions
-        for cx, cy, cz in brick.cubes:
-            x, y, z = old_pos[0] + cx, old_pos[1] + cy, old_pos[2] + cz
-            self.grid[x, y, z] = 0
-        # set new positions
-        for cx, cy, cz in brick.cubes:
-            x, y, z = new_pos[0] + cx, new_pos[1] + cy, new_pos[2] + cz
-            self.grid[x, y, z] = pid
+        brick, old_pos = self.placed[placement_id]
+        # touch only the cells that actually change: when old and new
+        # footprints overlap, the shared cells keep their id throughout
+        old = brick.cubes_np + np.asarray(old_pos, dtype=np.int8)
+        new = brick.cubes_np + np.asarray(new_pos, dtype=np.int8)
+        old_set = set(map(tuple, old.tolist()))
+        new_set = set(map(tuple, new.tolist()))
+        to_clear = old_set - new_set
+        to_set = new_set - old_set
+        if to_clear:
+            c = np.array(sorted(to_clear), dtype=np.int8)
+            self.grid[c[:, 0], c[:, 1], c[:, 2]] = 0
+            self._empty_mask[c[:, 0], c[:, 1], c[:, 2]] = True
+        if to_set:
+            s = np.array(sorted(to_set), dtype=np.int8)
+            self.grid[s[:, 0], s[:, 1], s[:, 2]] = placement_id
+            self._empty_mask[s[:, 0], s[:, 1], s[:, 2]] = False
+        self.occ = (self.occ & ~_brick_mask(brick, old_pos, self.size)) | _brick_mask(brick, new_pos, self.size)
         # update record
-        self.placed[placement_id] = (pid, brick, new_pos)
+        self.placed[placement_id] = (brick, new_pos)
 
     def num_left(self) -> int:
-        # Check if all positions are filled
-        num = 0
-        for x in range(self.size):
-            for y in range(self.size):
-                for z in range(self.size):
-                    if self.grid[x, y, z] == 0:
-                        num += 1
-        return num
-
-    def validate_placements(self, brick: Brick) -> List[Brick, Coord]:
-        placements = []   
-        empties = set()
-        for place in self.valid_placements.get(brick.name, set()):
-            x, y, z = place
-            if self.grid[x, y, z] == 0:
-                empties.add((x, y, z))
-
-        # quick reject
-        if not empties:
-            return placements
-
-        rotations = self.valid_brick_rotations.get(brick.name, set())
-        for e in empties:
-            for b in rotations:
-                if self.can_place(b, e):
-                    placements.append((b, e))
-        return placements
-
-    def can_not_place_somewhere(self, brick: Brick):
-        # Default behavior: check empty connected volumes and return True
-        # if the brick can be placed entirely inside any empty connected
-        # component (this examines all empty spaces).
-                        
-        empties = set()
-        for place in self.valid_placements.get(brick.name, set()):
-            x, y, z = place
-            if self.grid[x, y, z] == 0:
-                empties.add((x, y, z))
-
-        # quick reject
-        if not empties:
+        """Number of empty cells, from the occupancy bitboard's popcount."""
+        return self.size ** 3 - self.occ.bit_count()
+
+    def _occ_vec(self) -> np.ndarray:
+        """The occupancy bitboard as little-endian uint64 words, for ANDing
+        against the precomputed placement-mask rows."""
+        return np.frombuffer(self.occ.to_bytes(self._occ_words * 8, 'little'), dtype=np.uint64)
+
+    def validate_placements(self, brick: Brick) -> List[Tuple[Brick, Coord]]:
+        rot_bricks = self.valid_brick_rotations[brick.name]
+        if validate_placements_kernel is not None:
+            rows = validate_placements_kernel(self.grid, self._rot_cubes[brick.name],
+                                              self._anchor_limits[brick.name], self.size)
+            return [(rot_bricks[r], (int(x), int(y), int(z))) for r, x, y, z in rows]
+        # fallback: a placement is legal iff its precomputed mask row shares
+        # no bit with the occupancy words — one SIMD-friendly AND over all rows
+        blocked = (self._placement_masks[brick.name] & self._occ_vec()).any(axis=1)
+        rows = self._placement_rows[brick.name][~blocked]
+        return [(rot_bricks[r], (int(x), int(y), int(z))) for r, x, y, z in rows]
+
+    def can_place_somewhere(self, brick: Brick, only_adjacent: bool = False,
+                            min_distinct_adjacent: int = 1) -> bool:
+        """Return True if `brick` fits somewhere on the grid, stopping at the first hit.
+
+        With only_adjacent, the placement must additionally touch at least
+        `min_distinct_adjacent` distinct already-placed bricks (face contact).
+        Only a yes/no answer is needed, so the scan early-exits instead of
+        enumerating every placement.
+        """
+        if self.num_left() < len(brick.cubes):
             return False
-
-        rotations = self.valid_brick_rotations.get(brick.name, set())
-        for e in empties:
-            is_ok=False
+        size = self.size
+        rotations = self.valid_brick_rotations.get(brick.name, ())
+        # candidate anchors: empty cells within the brick's valid-anchor set,
+        # found with one vectorized AND instead of a filtered Python loop
+        for ex, ey, ez in np.argwhere(self._empty_mask & self._valid_placement_mask[brick.name]):
+            e = (int(ex), int(ey), int(ez))
             for b in rotations:
-                is_ok = self.can_place(b, e)
-                if is_ok:
-                    break
-            if not is_ok:
-                print(f"can not place {brick.name} at {e} with some rotation")
-                return True
+                if not self.can_place(b, e):
+                    continue
+                if not only_adjacent:
+                    return True
+                neighbors = set()
+                for cx, cy, cz in b.cubes:
+                    x, y, z = e[0] + cx, e[1] + cy, e[2] + cz
+                    for dx, dy, dz in ((1,0,0),(-1,0,0),(0,1,0),(0,-1,0),(0,0,1),(0,0,-1)):
+                        sx, sy, sz = x + dx, y + dy, z + dz
+                        if 0 <= sx < size and 0 <= sy < size and 0 <= sz < size:
+                            pid = self.grid[sx, sy, sz]
+                            if pid != 0:
+                                neighbors.add(int(pid))
+                if len(neighbors) >= min_distinct_adjacent:
+                    return True
         return False
 
+    def can_not_place_somewhere(self, brick: Brick) -> bool:
+        """Return True if some empty valid anchor admits no rotation of `brick`.
+
+        Detects dead/blocked anchors. Fully vectorized over the precomputed
+        placement-mask rows — no per-anchor Python loop — so it is cheap
+        enough to call as a pruning check inside a solver loop.
+        """
+        legal = ~(self._placement_masks[brick.name] & self._occ_vec()).any(axis=1)
+        # anchors with at least one legal row are alive
+        alive = np.zeros(self.size ** 3, dtype=bool)
+        alive[self._anchor_flat[brick.name][legal]] = True
+        dead = (self._valid_placement_mask[brick.name].ravel()
+                & self._empty_mask.ravel() & ~alive)
+        return bool(dead.any())
+
 
     def show(self) -> None:
         # We'll use matplotlib voxels. Convert grid->bool and facecolors
         filled = self.grid != 0
-        # simple color map by placement id
-        unique_ids = np.unique(self.grid[self.grid != 0])
-        colors = {}
+        # color by each id's rank among the ids present, so palettes stay
+        # stable and dense even when removals leave gaps in the pid sequence
+        unique_ids, inv = np.unique(self.grid, return_inverse=True)
+        ranks = np.arange(len(unique_ids))
+        if len(unique_ids) and unique_ids[0] == 0:
+            ranks -= 1  # rank among placed ids only; the empty slot is masked below
+            unique_ids = unique_ids[1:]
         cmap = plt.get_cmap("tab20")
-        for i, pid in enumerate(unique_ids):
-            colors[pid] = cmap(i % 20)
-
-        facecolors = np.empty(filled.shape + (4,), dtype=float)
-        facecolors[:] = (0, 0, 0, 0)
-        for x in range(self.size):
-            for y in range(self.size):
-                for z in range(self.size):
-                    pid = self.grid[x, y, z]
-                    if pid != 0:
-                        facecolors[x, y, z] = colors.get(pid, (0.5, 0.5, 0.5, 1.0))
+        lut = cmap(ranks % 20)
+        facecolors = lut[inv].reshape(self.grid.shape + (4,))
+        facecolors[~filled] = (0, 0, 0, 0)
 
         fig = plt.figure(figsize=(6, 6))
         ax = fig.add_subplot(111, projection="3d")
@@ -345,20 +509,8 @@ class CubeGrid:
 
 
 def sample_bricks() -> Dict[str, Brick]:
-    """Return a few sample 4-cube bricks (polycubes of 4). Coordinates chosen small and easy to rotate."""
-    bricks = {
-        # T-shape
-        'T': Brick([(0, 0, 0), (1, 0, 0), (2, 0, 0), (1, 1, 0)], name='T'),
-        # straight line of 4
-        'I': Brick([(0, 0, 0), (1, 0, 0), (2, 0, 0), (3, 0, 0)], name='I'),
-        # L-shape: 3 in a line + one attached at end
-        'L': Brick([(0, 0, 0), (1, 0, 0), (2, 0, 0), (2, 1, 0)], name='L'),
-        # square 2x2 (flat)
-        'O': Brick([(0, 0, 0), (1, 0, 0), (0, 1, 0), (1, 1, 0)], name='O'),
-        # a small 3D hook
-        'S3D': Brick([(0, 0, 0), (1, 0, 0), (1, 1, 0), (1, 1, 1)], name='S3D')
-    }
-    return bricks
+    """Return the sample 4-cube bricks (polycubes of 4). Coordinates chosen small and easy to rotate."""
+    return _BRICK_TEMPLATES
 
 
 def parse_ints(parts: List[str]) -> List[int]:
@@ -0,0 +1,106 @@
+# cython: boundscheck=False, wraparound=False, language_level=3
+"""solver.pyx
+
+Cython variant of the placement-search kernel in `solver_numba.py`, for
+environments where numba cannot be installed. Build in place with:
+
+    cythonize -i solver.pyx
+
+Callers guard the import and fall back to the pure-Python bitmask search when
+neither compiled kernel is available. Same contract as the numba kernel:
+identical inputs, identical output rows in identical order.
+"""
+import numpy as np
+
+
+cpdef find_placements_kernel(const unsigned char[:, :, ::1] grid,
+                             const signed char[:, :, ::1] rot_cubes,
+                             const signed char[:, ::1] rot_ids,
+                             int size, bint only_adjacent):
+    """Enumerate all placements of a 4-cube brick over precomputed rotations.
+
+    grid: contiguous uint8 (size,size,size) array, 0 = empty cell.
+    rot_cubes: int8 (R,4,3) normalized cube coordinates per rotation.
+    rot_ids: int8 (R,3) the (rx,ry,rz) triple that produced each rotation.
+    Returns an int32 (N,6) array of (x,y,z,rx,ry,rz) rows, deduplicated by
+    occupied cells in first-come order.
+    """
+    cdef int n_rot = rot_cubes.shape[0]
+    out_arr = np.empty((n_rot * size * size * size, 6), dtype=np.int32)
+    cdef int[:, ::1] out = out_arr
+    cdef int n = 0
+    cdef set seen = set()
+    cdef int r, i, x, y, z, ex, ey, ez, nx, ny, nz
+    cdef long long f0, f1, f2, f3, tmp, key
+    cdef bint ok, touches
+    for r in range(n_rot):
+        ex = 0
+        ey = 0
+        ez = 0
+        for i in range(4):
+            if rot_cubes[r, i, 0] > ex:
+                ex = rot_cubes[r, i, 0]
+            if rot_cubes[r, i, 1] > ey:
+                ey = rot_cubes[r, i, 1]
+            if rot_cubes[r, i, 2] > ez:
+                ez = rot_cubes[r, i, 2]
+        for x in range(size - ex):
+            for y in range(size - ey):
+                for z in range(size - ez):
+                    ok = True
+                    for i in range(4):
+                        if grid[x + rot_cubes[r, i, 0], y + rot_cubes[r, i, 1], z + rot_cubes[r, i, 2]] != 0:
+                            ok = False
+                            break
+                    if not ok:
+                        continue
+                    # dedup key: the 4 occupied flat cell indices, sorted and
+                    # packed 8 bits each (216 cells fit in a byte)
+                    f0 = ((x + rot_cubes[r, 0, 0]) * size + (y + rot_cubes[r, 0, 1])) * size + z + rot_cubes[r, 0, 2]
+                    f1 = ((x + rot_cubes[r, 1, 0]) * size + (y + rot_cubes[r, 1, 1])) * size + z + rot_cubes[r, 1, 2]
+                    f2 = ((x + rot_cubes[r, 2, 0]) * size + (y + rot_cubes[r, 2, 1])) * size + z + rot_cubes[r, 2, 2]
+                    f3 = ((x + rot_cubes[r, 3, 0]) * size + (y + rot_cubes[r, 3, 1])) * size + z + rot_cubes[r, 3, 2]
+                    if f0 > f1:
+                        tmp = f0; f0 = f1; f1 = tmp
+                    if f2 > f3:
+                        tmp = f2; f2 = f3; f3 = tmp
+                    if f0 > f2:
+                        tmp = f0; f0 = f2; f2 = tmp
+                    if f1 > f3:
+                        tmp = f1; f1 = f3; f3 = tmp
+                    if f1 > f2:
+                        tmp = f1; f1 = f2; f2 = tmp
+                    key = f0 | (f1 << 8) | (f2 << 16) | (f3 << 24)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    if only_adjacent:
+                        touches = False
+                        for i in range(4):
+                            nx = x + rot_cubes[r, i, 0]
+                            ny = y + rot_cubes[r, i, 1]
+                            nz = z + rot_cubes[r, i, 2]
+                            if nx > 0 and grid[nx - 1, ny, nz] != 0:
+                                touches = True
+                            elif nx < size - 1 and grid[nx + 1, ny, nz] != 0:
+                                touches = True
+                            elif ny > 0 and grid[nx, ny - 1, nz] != 0:
+                                touches = True
+                            elif ny < size - 1 and grid[nx, ny + 1, nz] != 0:
+                                touches = True
+                            elif nz > 0 and grid[nx, ny, nz - 1] != 0:
+                                touches = True
+                            elif nz < size - 1 and grid[nx, ny, nz + 1] != 0:
+                                touches = True
+                            if touches:
+                                break
+                        if not touches:
+                            continue
+                    out[n, 0] = x
+                    out[n, 1] = y
+                    out[n, 2] = z
+                    out[n, 3] = rot_ids[r, 0]
+                    out[n, 4] = rot_ids[r, 1]
+                    out[n, 5] = rot_ids[r, 2]
+                    n += 1
+    return out_arr[:n]
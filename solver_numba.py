@@ -0,0 +1,141 @@
+"""solver_numba.py
+
+Optional Numba-compiled kernel for the placement search used by the GUI.
+
+Importing this module requires `numba` (not a hard dependency of the project);
+callers should guard the import and fall back to the pure-Python bitmask
+search when it is unavailable:
+
+    try:
+        from solver_numba import find_placements_kernel
+    except Exception:
+        find_placements_kernel = None
+"""
+from __future__ import annotations
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def validate_placements_kernel(grid, rot_cubes, limits, size):
+    """Enumerate (rotation, anchor) pairs where a brick fits on the grid.
+
+    grid: (size,size,size) integer array, 0 = empty cell.
+    rot_cubes: int8 (R,4,3) normalized cube coordinates per rotation.
+    limits: (R,3) exclusive per-axis anchor bounds (size - extent).
+    Returns an int32 (N,4) array of (rot_idx, x, y, z) rows for every anchor
+    whose cell is empty and where that rotation overlaps no occupied cell.
+    """
+    cap = rot_cubes.shape[0] * size * size * size
+    out = np.empty((cap, 4), dtype=np.int32)
+    n = 0
+    for r in range(rot_cubes.shape[0]):
+        cubes = rot_cubes[r]
+        for x in range(limits[r, 0]):
+            for y in range(limits[r, 1]):
+                for z in range(limits[r, 2]):
+                    if grid[x, y, z] != 0:
+                        continue
+                    ok = True
+                    for i in range(4):
+                        if grid[x + cubes[i, 0], y + cubes[i, 1], z + cubes[i, 2]] != 0:
+                            ok = False
+                            break
+                    if ok:
+                        out[n, 0] = r
+                        out[n, 1] = x
+                        out[n, 2] = y
+                        out[n, 3] = z
+                        n += 1
+    return out[:n]
+
+
+@njit(cache=True)
+def find_placements_kernel(grid, rot_cubes, rot_ids, size, only_adjacent):
+    """Enumerate all placements of a 4-cube brick over precomputed rotations.
+
+    grid: contiguous uint8 (size,size,size) array, 0 = empty cell.
+    rot_cubes: int8 (R,4,3) normalized cube coordinates per rotation.
+    rot_ids: int8 (R,3) the (rx,ry,rz) triple that produced each rotation.
+    Returns an int32 (N,6) array of (x,y,z,rx,ry,rz) rows, deduplicated by
+    occupied cells in first-come order (same order as the Python search).
+
+    The enumeration is serial rather than prange-parallel: the dedup set is
+    shared across rotations and the whole scan is only ~14k candidates.
+    """
+    cap = rot_cubes.shape[0] * size * size * size
+    out = np.empty((cap, 6), dtype=np.int32)
+    n = 0
+    seen = {np.int64(-1)}
+    for r in range(rot_cubes.shape[0]):
+        cubes = rot_cubes[r]
+        ex = np.int64(0)
+        ey = np.int64(0)
+        ez = np.int64(0)
+        for i in range(4):
+            if cubes[i, 0] > ex:
+                ex = np.int64(cubes[i, 0])
+            if cubes[i, 1] > ey:
+                ey = np.int64(cubes[i, 1])
+            if cubes[i, 2] > ez:
+                ez = np.int64(cubes[i, 2])
+        for x in range(size - ex):
+            for y in range(size - ey):
+                for z in range(size - ez):
+                    ok = True
+                    for i in range(4):
+                        if grid[x + cubes[i, 0], y + cubes[i, 1], z + cubes[i, 2]] != 0:
+                            ok = False
+                            break
+                    if not ok:
+                        continue
+                    # dedup key: the 4 occupied flat cell indices, sorted and
+                    # packed 8 bits each (216 cells fit in a byte) into int64
+                    f0 = np.int64(((x + cubes[0, 0]) * size + (y + cubes[0, 1])) * size + z + cubes[0, 2])
+                    f1 = np.int64(((x + cubes[1, 0]) * size + (y + cubes[1, 1])) * size + z + cubes[1, 2])
+                    f2 = np.int64(((x + cubes[2, 0]) * size + (y + cubes[2, 1])) * size + z + cubes[2, 2])
+                    f3 = np.int64(((x + cubes[3, 0]) * size + (y + cubes[3, 1])) * size + z + cubes[3, 2])
+                    if f0 > f1:
+                        f0, f1 = f1, f0
+                    if f2 > f3:
+                        f2, f3 = f3, f2
+                    if f0 > f2:
+                        f0, f2 = f2, f0
+                    if f1 > f3:
+                        f1, f3 = f3, f1
+                    if f1 > f2:
+                        f1, f2 = f2, f1
+                    key = f0 | (f1 << 8) | (f2 << 16) | (f3 << 24)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    if only_adjacent:
+                        touches = False
+                        for i in range(4):
+                            nx = x + cubes[i, 0]
+                            ny = y + cubes[i, 1]
+                            nz = z + cubes[i, 2]
+                            if nx > 0 and grid[nx - 1, ny, nz] != 0:
+                                touches = True
+                            elif nx < size - 1 and grid[nx + 1, ny, nz] != 0:
+                                touches = True
+                            elif ny > 0 and grid[nx, ny - 1, nz] != 0:
+                                touches = True
+                            elif ny < size - 1 and grid[nx, ny + 1, nz] != 0:
+                                touches = True
+                            elif nz > 0 and grid[nx, ny, nz - 1] != 0:
+                                touches = True
+                            elif nz < size - 1 and grid[nx, ny, nz + 1] != 0:
+                                touches = True
+                            if touches:
+                                break
+                        if not touches:
+                            continue
+                    out[n, 0] = x
+                    out[n, 1] = y
+                    out[n, 2] = z
+                    out[n, 3] = rot_ids[r, 0]
+                    out[n, 4] = rot_ids[r, 1]
+                    out[n, 5] = rot_ids[r, 2]
+                    n += 1
+    return out[:n]